@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run
 # /// script
 # requires-python = ">=3.13"
-# dependencies = []
+# dependencies = ["orjson", "ijson", "pyahocorasick"]
 # ///
 """
 OpenCode Session Analyzer - Find and export sessions with write tools containing patterns
@@ -21,19 +21,142 @@ Usage:
 
 Direct execution from GitHub:
   uv run https://raw.githubusercontent.com/rwese/opencode_session_analyzer/main/oc_session_analyzer.py
+
+This file also holds the implementation shared by session_analyzer.py and
+export_matching_sessions.py, so it stays runnable as a single file.
 """
 
 import subprocess
 import json
 import sys
 import argparse
+import errno
+import io
 import tempfile
+import mmap
 import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+
+try:
+    # Much faster than the stdlib parser on large exports; same Python objects
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Walks huge exports one message at a time instead of building the full tree
+    import ijson
+
+    _JSON_PARSE_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_PARSE_ERRORS = (json.JSONDecodeError,)
+
+try:
+    # Only needed to clear O_DIRECT for the final unaligned write (--direct-io)
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    # Matches many patterns in a single pass over the content
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Pattern searched for in write tool content
+_PATTERN = "</content>"
+
+# Matching exports at least this large are parsed incrementally with ijson
+_STREAM_PARSE_THRESHOLD = 64 << 20
+
+# Chunk size used when streaming exports from the opencode pipe into found/
+_COPY_CHUNK_SIZE = 1 << 20
+
+# Exports are latency-bound on the opencode child process, so threads suffice
+DEFAULT_JOBS = os.cpu_count() or 8
+
+# Cached `opencode session list` output, reused while younger than the TTL and
+# while opencode's session storage has not changed
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "oc_session_analyzer",
+)
+SESSIONS_CACHE_FILE = os.path.join(CACHE_DIR, "sessions.json")
+SESSIONS_CACHE_TTL = 60
+OPENCODE_SESSION_DIR = os.path.join(
+    os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"),
+    "opencode",
+    "storage",
+    "session",
+)
+
+
+def _session_store_mtime():
+    """Latest mtime of opencode's session storage directories, or None"""
+    try:
+        mtime = os.stat(OPENCODE_SESSION_DIR).st_mtime
+        with os.scandir(OPENCODE_SESSION_DIR) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    mtime = max(mtime, entry.stat().st_mtime)
+        return mtime
+    except OSError:
+        return None
+
+
+def _load_cached_sessions(store_mtime):
+    """Return the cached session list if it is still fresh, otherwise None"""
+    try:
+        if time.time() - os.path.getmtime(SESSIONS_CACHE_FILE) >= SESSIONS_CACHE_TTL:
+            return None
+        with open(SESSIONS_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if cache.get("store_mtime") != store_mtime:
+        return None
+    return cache.get("sessions")
+
+
+def _save_cached_sessions(sessions, store_mtime):
+    """Write the session list cache, ignoring failures"""
+    tmp_path = f"{SESSIONS_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump({"store_mtime": store_mtime, "sessions": sessions}, f)
+        os.replace(tmp_path, SESSIONS_CACHE_FILE)
+    except OSError:
+        # The cache is only an optimization
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def get_sessions(verbose=False, refresh=False):
+    """Get list of sessions from opencode CLI
 
+    The list is cached for SESSIONS_CACHE_TTL seconds; pass refresh=True to
+    bypass the cache.
+    """
+    store_mtime = _session_store_mtime()
+    if not refresh:
+        sessions = _load_cached_sessions(store_mtime)
+        if sessions is not None:
+            if verbose:
+                print(
+                    f"Using cached session list ({len(sessions)} sessions)",
+                    file=sys.stderr,
+                )
+            return sessions
 
-def get_sessions(verbose=False):
-    """Get list of sessions from opencode CLI"""
     try:
         if verbose:
             print("Fetching session list...", file=sys.stderr)
@@ -46,6 +169,7 @@ def get_sessions(verbose=False):
         sessions = json.loads(result.stdout)
         if verbose:
             print(f"Found {len(sessions)} sessions", file=sys.stderr)
+        _save_cached_sessions(sessions, store_mtime)
         return sessions
     except subprocess.CalledProcessError as e:
         print(f"Error executing opencode session list: {e}", file=sys.stderr)
@@ -55,74 +179,130 @@ def get_sessions(verbose=False):
         return []
 
 
-def export_session(session_id, verbose=False):
-    """Export single session data
+def _export_via_tempfile(session_id, pattern=_PATTERN, patterns=None):
+    """Run opencode export with stdout redirected to a temp file and parse it
 
-    Note: opencode export truncates output when piped, so we use shell redirection
-    to a temp file to get complete output.
-    """
-    try:
-        if verbose:
-            print(f"Exporting session {session_id}...", file=sys.stderr)
+    If patterns (bytes) are given, the file is scanned in place first and
+    nothing is parsed when none of them occur. The export is parsed straight
+    from the file, so large exports are never read into memory whole.
 
-        # Use temporary file to avoid pipe truncation bug in opencode export
-        with tempfile.NamedTemporaryFile(
-            mode="w+", suffix=".json", delete=False
-        ) as tmp:
-            tmp_path = tmp.name
+    Returns:
+        tuple of (session info dict, list of matches)
+    """
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        tmp_path = tmp.name
 
-        try:
-            # Use shell=True with redirection to avoid pipe truncation
-            cmd = f"opencode export {session_id} > {tmp_path} 2>/dev/null"
-            result = subprocess.run(
-                cmd,
-                shell=True,
+    try:
+        # Redirect stdout straight to the file to avoid pipe truncation
+        with open(tmp_path, "wb") as out:
+            subprocess.run(
+                ["opencode", "export", session_id],
+                stdout=out,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
 
-            # Read the complete output from file
-            with open(tmp_path, "r") as f:
-                output = f.read()
-
-            # Strip the "Exporting session:" prefix if present
-            if output.startswith("Exporting session:"):
-                json_start = output.find("{")
-                if json_start != -1:
-                    output = output[json_start:]
-
-            session_data = json.loads(output)
-            return session_data
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        with open(tmp_path, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return {}, []
+            if patterns is not None:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if not any(mm.find(p) != -1 for p in patterns):
+                        return {}, []
+
+            # Skip the "Exporting session:" prefix if present
+            head = f.read(_COPY_CHUNK_SIZE)
+            json_start = 0
+            if head.startswith(b"Exporting session:"):
+                json_start = max(head.find(b"{"), 0)
+            f.seek(json_start)
+            return _parse_export(f, pattern)
+    finally:
+        # Clean up temp file
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _read_piped_export(session_id, verbose=False):
+    """Run opencode export and return the raw session JSON read from the pipe
+
+    Note: opencode export truncates output when piped, which is why exports
+    go through _export_via_tempfile by default. None is returned when the
+    output does not end with the closing brace of the session. Piped output
+    can still be truncated elsewhere, so callers should fall back to the temp
+    file if it fails to parse.
+    """
+    result = subprocess.run(
+        ["opencode", "export", session_id],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    output = result.stdout
 
-    except subprocess.CalledProcessError as e:
-        if verbose:
-            print(f"Error exporting session {session_id}: {e}", file=sys.stderr)
-        return None
-    except json.JSONDecodeError as e:
+    # A complete export always ends with the closing brace of the session
+    if not output.rstrip().endswith(b"}"):
         if verbose:
             print(
-                f"⚠ Skipping session {session_id} (JSON parse error)",
+                f"Piped export of {session_id} looks truncated, retrying",
                 file=sys.stderr,
             )
         return None
 
+    # Strip the "Exporting session:" prefix if present
+    if output.startswith(b"Exporting session:"):
+        json_start = output.find(b"{")
+        if json_start != -1:
+            output = output[json_start:]
 
-def find_write_tools_with_pattern(session_data, pattern="</content>"):
-    """Find write tools with pattern in content
+    return output
 
-    Returns:
-        list of dicts with matching content and metadata, or empty list if no matches
-        Each dict contains: {'content': str, 'filePath': str, 'messageID': str, 'jqPath': str}
+
+def _as_patterns(pattern):
+    """Normalize a pattern argument (None, a string or strings) to a tuple"""
+    if pattern is None:
+        return (_PATTERN,)
+    if isinstance(pattern, str):
+        return (pattern,)
+    return tuple(pattern)
+
+
+@lru_cache
+def _raw_pattern(pattern):
+    """Return pattern as bytes the way it appears in the raw export JSON
+
+    Quotes, backslashes and control characters are escaped inside JSON
+    strings, so the plain encoded pattern would never be found in the raw
+    export for patterns containing them.
     """
-    matches = []
+    return json.dumps(pattern, ensure_ascii=False)[1:-1].encode()
 
-    if not session_data or "messages" not in session_data:
-        return matches
 
-    for msg_idx, message in enumerate(session_data["messages"]):
+@lru_cache
+def _compile_patterns(patterns):
+    """Return a function listing which of patterns occur in a string
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed and there
+    is more than one pattern. Compiled once per tuple of patterns.
+    """
+    if ahocorasick is not None and len(patterns) > 1:
+        automaton = ahocorasick.Automaton()
+        for idx, p in enumerate(patterns):
+            automaton.add_word(p, idx)
+        automaton.make_automaton()
+        return lambda content: [
+            patterns[idx] for idx in sorted({idx for _, idx in automaton.iter(content)})
+        ]
+
+    return lambda content: [p for p in patterns if p in content]
+
+
+def _find_in_messages(messages, pattern):
+    """Find write tools with pattern in content across an iterable of messages"""
+    find_patterns = _compile_patterns(_as_patterns(pattern))
+    matches = []
+
+    for msg_idx, message in enumerate(messages):
         if "parts" not in message:
             continue
         for part_idx, part in enumerate(message["parts"]):
@@ -134,7 +314,8 @@ def find_write_tools_with_pattern(session_data, pattern="</content>"):
                 and "content" in part["state"]["input"]
             ):
                 content = part["state"]["input"]["content"]
-                if pattern in content:
+                found = find_patterns(content)
+                if found:
                     # Create jq path to this specific write tool
                     jq_path = (
                         f".messages[{msg_idx}].parts[{part_idx}].state.input.content"
@@ -148,77 +329,236 @@ def find_write_tools_with_pattern(session_data, pattern="</content>"):
                             ),
                             "messageID": message.get("info", {}).get("id", "unknown"),
                             "jqPath": jq_path,
+                            "patterns": found,
                         }
                     )
 
     return matches
 
 
-def analyze_sessions(verbose=False):
-    """Analyze all sessions and return matches with metadata"""
-    sessions = get_sessions(verbose=verbose)
+def find_write_tools_with_pattern(session_data, pattern=_PATTERN):
+    """Find write tools with pattern in content
+
+    `pattern` may be a string or a list of strings; content matches if it
+    contains any of them.
+
+    Returns:
+        list of dicts with matching content and metadata, or empty list if no matches
+        Each dict contains: {'content': str, 'filePath': str, 'messageID': str,
+        'jqPath': str, 'patterns': list of the patterns found}
+    """
+    if not session_data or "messages" not in session_data:
+        return []
+
+    return _find_in_messages(session_data["messages"], pattern)
+
+
+def find_write_tools_in_stream(stream, pattern=_PATTERN):
+    """Find write tools with pattern in content of a session export stream
+
+    Same as find_write_tools_with_pattern, but messages are parsed one at a
+    time with ijson so only the current message is held in memory.
+    """
+    return _find_in_messages(ijson.items(stream, "messages.item"), pattern)
+
+
+def _parse_export(f, pattern):
+    """Parse a raw export and return (session info dict, list of matches)
+
+    f is a binary file positioned at the start of the export JSON. Exports of
+    at least _STREAM_PARSE_THRESHOLD bytes are parsed incrementally from it
+    when ijson is available.
+    """
+    start = f.tell()
+    size = f.seek(0, os.SEEK_END) - start
+    f.seek(start)
+    if ijson is not None and size >= _STREAM_PARSE_THRESHOLD:
+        info = next(ijson.items(f, "info"), {})
+        f.seek(start)
+        return info, find_write_tools_in_stream(f, pattern)
+
+    session_data = _json_loads(f.read())
+    matches = find_write_tools_with_pattern(session_data, pattern)
+    return session_data.get("info", {}), matches
+
+
+def analyze_session(session_id, verbose=False, pattern=_PATTERN, use_pipe=False):
+    """Export a single session and find write tools with pattern in content
+
+    The raw export is searched for the pattern(s) first, so sessions that
+    cannot match are never parsed. Exports of at least _STREAM_PARSE_THRESHOLD bytes
+    are parsed incrementally when ijson is available.
+
+    Returns:
+        tuple of (session info dict, list of matches), both empty if the
+        session has no matches or could not be exported
+    """
+    try:
+        if verbose:
+            print(f"Exporting session {session_id}...", file=sys.stderr)
+
+        patterns = tuple(_raw_pattern(p) for p in _as_patterns(pattern))
+        if use_pipe:
+            output = _read_piped_export(session_id, verbose=verbose)
+            if output is not None:
+                if not any(p in output for p in patterns):
+                    return {}, []
+                try:
+                    return _parse_export(io.BytesIO(output), pattern)
+                except _JSON_PARSE_ERRORS:
+                    # Piped output may be truncated even if it ends with a brace
+                    if verbose:
+                        print(
+                            f"Piped export of {session_id} did not parse, retrying",
+                            file=sys.stderr,
+                        )
+
+        return _export_via_tempfile(session_id, pattern=pattern, patterns=patterns)
+
+    except subprocess.CalledProcessError as e:
+        if verbose:
+            print(f"Error exporting session {session_id}: {e}", file=sys.stderr)
+        return {}, []
+    except _JSON_PARSE_ERRORS as e:
+        if verbose:
+            print(
+                f"⚠ Skipping session {session_id} (JSON parse error)",
+                file=sys.stderr,
+            )
+        return {}, []
+
+
+def _session_is_candidate(session, since=None, directory=None):
+    """Check session list metadata against the --since/--dir filters
+
+    Sessions whose metadata lacks a field are kept, since they cannot be ruled
+    out without exporting them.
+    """
+    if since is not None:
+        created = (session.get("time") or {}).get("created", session.get("created"))
+        if created and created < since:
+            return False
+
+    if directory is not None:
+        session_dir = session.get("directory")
+        if session_dir:
+            session_dir = os.path.normpath(session_dir)
+            if session_dir != directory and not session_dir.startswith(
+                directory.rstrip(os.sep) + os.sep
+            ):
+                return False
+
+    return True
+
+
+def format_timestamp(timestamp):
+    """Format a ms timestamp from session info as ISO 8601, or "unknown" if unset"""
+    if not timestamp:
+        return "unknown"
+    return datetime.fromtimestamp(timestamp / 1000).isoformat()
+
+
+def analyze_sessions(
+    verbose=False,
+    jobs=DEFAULT_JOBS,
+    use_pipe=False,
+    refresh=False,
+    since=None,
+    directory=None,
+    pattern=_PATTERN,
+):
+    """Analyze all sessions and return matches with metadata
+
+    Sessions are exported and searched concurrently using up to `jobs` worker
+    threads. `since` (ms timestamp) and `directory` skip sessions created
+    earlier or outside that directory before they are exported. `pattern` is
+    a string or list of strings to search write tool content for.
+
+    The "created" and "updated" values of each result are raw ms timestamps;
+    use format_timestamp to display them.
+    """
+    if directory is not None:
+        directory = os.path.abspath(directory)
+
+    sessions = get_sessions(verbose=verbose, refresh=refresh)
     if not sessions:
         if verbose:
             print("No sessions found or error occurred", file=sys.stderr)
         return []
 
-    total_sessions = len(sessions)
-    processed = 0
-    results = []
-
+    session_ids = []
     for session in sessions:
         session_id = session.get("id")
         if not session_id:
             if verbose:
                 print("Skipping session without ID", file=sys.stderr)
             continue
+        if not _session_is_candidate(session, since=since, directory=directory):
+            continue
+        session_ids.append(session_id)
 
-        processed += 1
-        if verbose:
-            print(
-                f"Processing session {processed}/{total_sessions}: {session_id}",
-                file=sys.stderr,
-            )
+    total_sessions = len(session_ids)
+    if verbose and (since is not None or directory is not None):
+        print(
+            f"{total_sessions} of {len(sessions)} sessions match --since/--dir",
+            file=sys.stderr,
+        )
 
-        session_data = export_session(session_id, verbose=verbose)
-        matching_writes = find_write_tools_with_pattern(session_data)
-
-        if matching_writes:
-            # Extract metadata from session_data
-            info = session_data.get("info", {}) if session_data else {}
-            created_timestamp = info.get("time", {}).get("created", 0)
-            created_iso = (
-                datetime.fromtimestamp(created_timestamp / 1000).isoformat()
-                if created_timestamp
-                else "unknown"
-            )
-            title = info.get("title", "unknown")
-            directory = info.get("directory", "unknown")
-
-            results.append(
-                {
-                    "session_id": session_id,
-                    "created": created_iso,
-                    "title": title,
-                    "directory": directory,
-                    "matches": matching_writes,
-                }
-            )
+    processed = 0
+    results = []
 
-            if verbose:
-                print(f"\n{'=' * 80}", file=sys.stderr)
-                print(f"✓ Match found in {session_id}", file=sys.stderr)
-                print(
-                    f"  Found {len(matching_writes)} write tool(s) with pattern",
-                    file=sys.stderr,
-                )
-                print(f"{'=' * 80}", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        analyzed = executor.map(
+            partial(
+                analyze_session,
+                verbose=verbose,
+                pattern=pattern,
+                use_pipe=use_pipe,
+            ),
+            session_ids,
+        )
+        try:
+            for session_id, (info, matching_writes) in zip(session_ids, analyzed):
+                processed += 1
+                if verbose:
+                    print(
+                        f"Processing session {processed}/{total_sessions}: {session_id}",
+                        file=sys.stderr,
+                    )
+
+                if matching_writes:
+                    # Extract metadata from the session info; timestamps stay raw
+                    # (ms) and are only formatted for display
+                    time_info = info.get("time", {})
+                    results.append(
+                        {
+                            "session_id": session_id,
+                            "created": time_info.get("created", 0),
+                            "title": info.get("title", "unknown"),
+                            "directory": info.get("directory", "unknown"),
+                            "updated": time_info.get("updated"),
+                            "matches": matching_writes,
+                        }
+                    )
 
-                for idx, match in enumerate(matching_writes, 1):
-                    print(f"\n--- Write Tool #{idx} ---", file=sys.stderr)
-                    print(f"File Path: {match['filePath']}", file=sys.stderr)
-                    print(f"Message ID: {match['messageID']}", file=sys.stderr)
-                    print(f"JQ Path: {match['jqPath']}", file=sys.stderr)
+                    if verbose:
+                        print(f"\n{'=' * 80}", file=sys.stderr)
+                        print(f"✓ Match found in {session_id}", file=sys.stderr)
+                        print(
+                            f"  Found {len(matching_writes)} write tool(s) with pattern",
+                            file=sys.stderr,
+                        )
+                        print(f"{'=' * 80}", file=sys.stderr)
+
+                        for idx, match in enumerate(matching_writes, 1):
+                            print(f"\n--- Write Tool #{idx} ---", file=sys.stderr)
+                            print(f"File Path: {match['filePath']}", file=sys.stderr)
+                            print(f"Message ID: {match['messageID']}", file=sys.stderr)
+                            print(f"JQ Path: {match['jqPath']}", file=sys.stderr)
+        except BaseException:
+            # Don't start the queued exports after Ctrl-C or an unexpected error
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     if verbose:
         print(
@@ -229,55 +569,289 @@ def analyze_sessions(verbose=False):
     return results
 
 
-def export_mode(results, verbose=False):
-    """Export matching sessions to found/ directory"""
+class _DirectIOWriter:
+    """Write-only file that bypasses the page cache using O_DIRECT
+
+    Data is staged in a page-aligned buffer and written in _COPY_CHUNK_SIZE
+    blocks. O_DIRECT requires block-aligned lengths, so the final partial
+    block is written after clearing O_DIRECT on the descriptor. O_DIRECT is
+    also cleared if a write is rejected with EINVAL.
+    """
+
+    def __init__(self, path):
+        self._fd = os.open(
+            path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644
+        )
+        self._direct = True
+        try:
+            # Anonymous mmaps are page-aligned, as O_DIRECT requires
+            self._buf = mmap.mmap(-1, _COPY_CHUNK_SIZE)
+            self._view = memoryview(self._buf)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self._filled = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _clear_direct(self):
+        flags = fcntl.fcntl(self._fd, fcntl.F_GETFL)
+        fcntl.fcntl(self._fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+        self._direct = False
+
+    def _write_all(self, data):
+        while data:
+            try:
+                written = os.write(self._fd, data)
+            except OSError as e:
+                # Some filesystems accept O_DIRECT at open but reject the writes
+                if e.errno != errno.EINVAL or not self._direct:
+                    raise
+                self._clear_direct()
+                continue
+            data = data[written:]
+
+    def write(self, data):
+        data = memoryview(data)
+        while data:
+            size = min(len(data), _COPY_CHUNK_SIZE - self._filled)
+            self._view[self._filled : self._filled + size] = data[:size]
+            self._filled += size
+            data = data[size:]
+            if self._filled == _COPY_CHUNK_SIZE:
+                self._write_all(self._view)
+                self._filled = 0
+
+    def close(self):
+        if self._fd is None:
+            return
+        try:
+            if self._filled:
+                if self._direct:
+                    self._clear_direct()
+                self._write_all(self._view[: self._filled])
+        finally:
+            self._view.release()
+            self._buf.close()
+            os.close(self._fd)
+            self._fd = None
+
+
+def _open_export_file(path, direct_io=False):
+    """Open path for writing an export, bypassing the page cache if requested
+
+    Falls back to a regular buffered file where O_DIRECT is unavailable or the
+    filesystem does not support it.
+    """
+    if direct_io and hasattr(os, "O_DIRECT") and fcntl is not None:
+        try:
+            return _DirectIOWriter(path)
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+    return open(path, "wb")
+
+
+def _copy_export(stream, out):
+    """Copy an opencode export from stream to out in a single pass
+
+    The "Exporting session:" prefix is dropped from the first chunk before
+    anything is written. With ijson, the copied bytes are also fed to an
+    incremental parser, so truncated output is caught without reading the
+    file back; otherwise only the closing brace of the session is checked.
+    Returns whether the output looks complete.
+    """
+    validator = None
+    if ijson is not None:
+        events = ijson.sendable_list()
+        validator = ijson.basic_parse_coro(events)
+
+    chunk = stream.read(_COPY_CHUNK_SIZE)
+    if chunk.startswith(b"Exporting session:"):
+        json_start = chunk.find(b"{")
+        if json_start != -1:
+            chunk = chunk[json_start:]
+
+    tail = b""
+    try:
+        while chunk:
+            out.write(chunk)
+            if validator is not None:
+                validator.send(chunk)
+                events.clear()
+            tail = chunk[-64:] if len(chunk) >= 64 else (tail + chunk)[-64:]
+            chunk = stream.read(_COPY_CHUNK_SIZE)
+        if validator is not None:
+            validator.close()
+    except _JSON_PARSE_ERRORS:
+        return False
+
+    return tail.rstrip().endswith(b"}")
+
+
+def _do_export(
+    session_id, output_file, updated=None, use_pipe=False, direct_io=False
+):
+    """Export a single session to output_file
+
+    If `updated` (ms timestamp of the session's last change) is given and
+    output_file is newer, the existing export is kept.
+
+    opencode writes the export itself, and the file is only rewritten if it
+    starts with the "Exporting session:" prefix. With use_pipe, the export is
+    streamed from the opencode pipe instead, falling back to the redirect if
+    opencode fails or the output is incomplete.
+
+    direct_io writes the export with O_DIRECT where supported. opencode's own
+    writes cannot bypass the page cache, so it implies use_pipe, and a
+    redirected export is copied into place instead of renamed.
+
+    Returns:
+        tuple of (file size, whether the session was exported)
+    """
+    if updated:
+        try:
+            stat = os.stat(output_file)
+            if stat.st_mtime * 1000 >= updated:
+                return stat.st_size, False
+        except FileNotFoundError:
+            pass
+
+    # Export into a temp file and only move it into place once it is done, so a
+    # failed export never leaves a partial file that looks up to date
+    tmp_file = output_file + ".tmp"
+    raw_file = output_file + ".raw"
+    try:
+        complete = False
+        if use_pipe or direct_io:
+            with (
+                _open_export_file(tmp_file, direct_io=direct_io) as out,
+                subprocess.Popen(
+                    ["opencode", "export", session_id],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                ) as proc,
+            ):
+                complete = _copy_export(proc.stdout, out)
+            # Only keep the streamed export if opencode succeeded and it looks
+            # complete, otherwise export it again through the redirect below
+            complete = complete and proc.returncode == 0
+
+        if not complete:
+            # Redirect stdout straight to the file to avoid pipe truncation
+            with open(raw_file, "wb") as out:
+                subprocess.run(
+                    ["opencode", "export", session_id],
+                    stdout=out,
+                    stderr=subprocess.DEVNULL,
+                    check=True,
+                )
+
+            # Strip "Exporting session:" prefix if present. Only the first chunk
+            # is read to find it, and the rest is copied only when there is one
+            # or the copy has to be written with O_DIRECT
+            with open(raw_file, "rb") as f:
+                head = f.read(_COPY_CHUNK_SIZE)
+                json_start = 0
+                if head.startswith(b"Exporting session:"):
+                    json_start = max(head.find(b"{"), 0)
+                copy = json_start or direct_io
+                if copy:
+                    f.seek(json_start)
+                    with _open_export_file(tmp_file, direct_io=direct_io) as out:
+                        shutil.copyfileobj(f, out, _COPY_CHUNK_SIZE)
+
+            if copy:
+                os.unlink(raw_file)
+            else:
+                os.replace(raw_file, tmp_file)
+
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        for path in (tmp_file, raw_file):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        raise
+
+    return os.path.getsize(output_file), True
+
+
+def export_mode(
+    results,
+    verbose=False,
+    jobs=DEFAULT_JOBS,
+    refresh=False,
+    use_pipe=False,
+    direct_io=False,
+):
+    """Export matching sessions to found/ directory
+
+    Sessions are exported concurrently; progress is reported in order.
+    Existing exports that are newer than the session are reused unless
+    refresh is set.
+    """
     # Create found/ directory
     found_dir = "found"
-    if not os.path.exists(found_dir):
+    try:
         os.makedirs(found_dir)
         print(f"Created directory: {os.path.abspath(found_dir)}/", file=sys.stderr)
+    except FileExistsError:
+        pass
 
     print(f"\nFound {len(results)} matching session(s)", file=sys.stderr)
     print(f"Exporting to {found_dir}/", file=sys.stderr)
     print("-" * 80, file=sys.stderr)
 
     # Export each session
-    for idx, result in enumerate(results, 1):
-        session_id = result["session_id"]
-        created = result["created"]
-        output_file = os.path.join(found_dir, f"{session_id}.json")
-
-        print(
-            f"[{idx}/{len(results)}] {created} - {session_id}...",
-            file=sys.stderr,
-        )
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = []
+        for result in results:
+            session_id = result["session_id"]
+            output_file = os.path.join(found_dir, f"{session_id}.json")
+            updated = None if refresh else result.get("updated")
+            future = executor.submit(
+                _do_export, session_id, output_file, updated, use_pipe, direct_io
+            )
+            futures.append((result, output_file, future))
 
         try:
-            # Use shell redirection to avoid truncation
-            cmd = f"opencode export {session_id} > {output_file} 2>/dev/null"
-            subprocess.run(cmd, shell=True, check=True)
-
-            # Strip "Exporting session:" prefix if present
-            with open(output_file, "r") as f:
-                content = f.read()
-
-            if content.startswith("Exporting session:"):
-                json_start = content.find("{")
-                if json_start != -1:
-                    content = content[json_start:]
-                    with open(output_file, "w") as f:
-                        f.write(content)
-
-            file_size = os.path.getsize(output_file)
-            print(
-                f"         ✓ Saved to {output_file} ({file_size:,} bytes)",
-                file=sys.stderr,
-            )
+            for idx, (result, output_file, future) in enumerate(futures, 1):
+                session_id = result["session_id"]
+                created = format_timestamp(result["created"])
+
+                print(
+                    f"[{idx}/{len(results)}] {created} - {session_id}...",
+                    file=sys.stderr,
+                )
 
-        except subprocess.CalledProcessError as e:
-            print(f"         ✗ Error exporting {session_id}: {e}", file=sys.stderr)
-        except Exception as e:
-            print(f"         ✗ Error processing {session_id}: {e}", file=sys.stderr)
+                try:
+                    file_size, exported = future.result()
+                    status = "Saved to" if exported else "Up to date:"
+                    print(
+                        f"         ✓ {status} {output_file} ({file_size:,} bytes)",
+                        file=sys.stderr,
+                    )
+
+                except subprocess.CalledProcessError as e:
+                    print(
+                        f"         ✗ Error exporting {session_id}: {e}",
+                        file=sys.stderr,
+                    )
+                except Exception as e:
+                    print(
+                        f"         ✗ Error processing {session_id}: {e}",
+                        file=sys.stderr,
+                    )
+        except BaseException:
+            # Don't start the queued exports after Ctrl-C or an unexpected error
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     print("-" * 80, file=sys.stderr)
     print(f"\n✅ Export complete! Sessions saved in {found_dir}/", file=sys.stderr)
@@ -285,6 +859,95 @@ def export_mode(results, verbose=False):
     print(f"  jq '.info.title' {found_dir}/*.json", file=sys.stderr)
 
 
+def print_results(results):
+    """Print results to stdout (tab-separated)
+
+    Columns: session_id, created_iso, title, directory, jq_paths
+
+    All lines are written with a single call instead of one print per result.
+    """
+    lines = []
+    for result in results:
+        jq_paths = ";".join([match["jqPath"] for match in result["matches"]])
+        created = format_timestamp(result["created"])
+        lines.append(
+            f"{result['session_id']}\t{created}\t{result['title']}\t{result['directory']}\t{jq_paths}\n"
+        )
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
+
+
+def _positive_int(value):
+    """argparse type for options that need a count of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _since_timestamp(value):
+    """argparse type turning an ISO date or datetime into a ms timestamp"""
+    try:
+        return datetime.fromisoformat(value).timestamp() * 1000
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO date: {value!r}")
+
+
+def add_common_arguments(parser):
+    """Add the options shared by all session analyzer entry points"""
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Enable verbose output to stderr"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help=f"Number of sessions to export in parallel (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--pipe",
+        action="store_true",
+        help="Read exports from the opencode pipe instead of a temp file "
+        "(faster, but opencode may truncate piped output)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached session list and previously exported files",
+    )
+    parser.add_argument(
+        "--since",
+        type=_since_timestamp,
+        metavar="DATE",
+        help="Only analyze sessions created on or after DATE (ISO format)",
+    )
+    parser.add_argument(
+        "--dir",
+        dest="directory",
+        metavar="PATH",
+        help="Only analyze sessions whose working directory is PATH or below it",
+    )
+    parser.add_argument(
+        "--pattern",
+        dest="patterns",
+        action="append",
+        metavar="PATTERN",
+        help="Pattern to search write tool content for; repeat for several "
+        f"(default: {_PATTERN})",
+    )
+
+
+def add_export_arguments(parser):
+    """Add the options shared by entry points that export to found/"""
+    parser.add_argument(
+        "--direct-io",
+        action="store_true",
+        help="Write exports with O_DIRECT, bypassing the page cache (Linux only, "
+        "implies --pipe for the export step)",
+    )
+
+
 def main():
     """Main execution"""
     parser = argparse.ArgumentParser(
@@ -305,19 +968,26 @@ Examples:
   %(prog)s --export --verbose
         """,
     )
-    parser.add_argument(
-        "--verbose", "-v", action="store_true", help="Enable verbose output to stderr"
-    )
+    add_common_arguments(parser)
     parser.add_argument(
         "--export",
         "-e",
         action="store_true",
         help="Export matching sessions to found/ directory",
     )
+    add_export_arguments(parser)
     args = parser.parse_args()
 
     # Analyze sessions
-    results = analyze_sessions(verbose=args.verbose)
+    results = analyze_sessions(
+        verbose=args.verbose,
+        jobs=args.jobs,
+        use_pipe=args.pipe,
+        refresh=args.refresh,
+        since=args.since,
+        directory=args.directory,
+        pattern=args.patterns,
+    )
 
     if not results:
         if not args.verbose:
@@ -326,14 +996,16 @@ Examples:
 
     # Export mode or print mode
     if args.export:
-        export_mode(results, verbose=args.verbose)
+        export_mode(
+            results,
+            verbose=args.verbose,
+            jobs=args.jobs,
+            refresh=args.refresh,
+            use_pipe=args.pipe,
+            direct_io=args.direct_io,
+        )
     else:
-        # Print to stdout (tab-separated)
-        for result in results:
-            jq_paths = ";".join([match["jqPath"] for match in result["matches"]])
-            print(
-                f"{result['session_id']}\t{result['created']}\t{result['title']}\t{result['directory']}\t{jq_paths}"
-            )
+        print_results(results)
 
 
 if __name__ == "__main__":